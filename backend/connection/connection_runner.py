@@ -1,12 +1,14 @@
 """Provide the ConnectionRunner class."""
 
 import asyncio
-import json
 import logging
+import os
 import sys
+import threading
 import time
-from typing import Any
+from typing import Any, Awaitable, Callable, Coroutine
 
+import orjson
 from aiortc import RTCSessionDescription
 
 from connection.connection import Connection, connection_factory
@@ -32,19 +34,53 @@ class ConnectionRunner:
     """
 
     _connection: Connection | None
-    _lock: asyncio.Lock
     _running: bool
     _stopped_event: asyncio.Event
     _tasks: list[asyncio.Task]
     _logger: logging.Logger
+    _loop: asyncio.AbstractEventLoop
+    _inbox: asyncio.Queue[bytes]
+    _reader_thread: threading.Thread
+    _outbox: asyncio.Queue[tuple[str, Any, int] | None]
+    _writer: asyncio.Task | None
+    _relay_done: asyncio.Future[None]
+    _handlers: dict[str, Callable[[Any, int], Coroutine[Any, Any, None]]]
+
+    # Commands whose payloads can be large (SDP, api messages).  Encoding them
+    # is offloaded to a thread to keep the event loop responsive.
+    _OFFLOAD_COMMANDS = frozenset(
+        ["SET_LOCAL_DESCRIPTION", "CONNECTION_PROPOSAL", "CONNECTION_ANSWER", "API"]
+    )
 
     def __init__(self) -> None:
         """Instantiate new ConnectionRunner."""
         self._connection = None
-        self._lock = asyncio.Lock()
         self._running = False
         self._tasks = []
         self._stopped_event = asyncio.Event()
+        self._loop = asyncio.get_event_loop()
+        self._inbox = asyncio.Queue()
+        self._outbox = asyncio.Queue()
+        self._writer = self._loop.create_task(self._write_outbox())
+        # Completed future returned by `_relay_api_message`, reused across calls.
+        self._relay_done = self._loop.create_future()
+        self._relay_done.set_result(None)
+        self._handlers = {
+            "PING": self._handle_ping,
+            "SEND": self._handle_send,
+            "CREATE_PROPOSAL": self._handle_create_proposal,
+            "HANDLE_OFFER": self._handle_offer,
+            "STOP_SUBCONNECTION": self._handle_stop_subconnection,
+            "SET_MUTED": self._handle_set_muted,
+            "SET_VIDEO_FILTERS": self._handle_set_video_filters,
+            "SET_AUDIO_FILTERS": self._handle_set_audio_filters,
+            "START_RECORDING": self._handle_start_recording,
+            "STOP_RECORDING": self._handle_stop_recording,
+        }
+        self._reader_thread = threading.Thread(
+            target=self._read_stdin, name="StdinReader", daemon=True
+        )
+        self._reader_thread.start()
         config = Config()
 
         # Setup logging for subprocess
@@ -103,32 +139,39 @@ class ConnectionRunner:
         `_stopped_event`.
         """
         self._logger.debug("ConnectionRunner Stopping")
-        async with self._lock:
-            self._running = False
+        self._running = False
+        # Wake up `_listen_for_messages` instead of waiting for the next message.
+        self._inbox.put_nowait(b"q")
         await asyncio.gather(*self._tasks)
+        if self._writer is not None:
+            # Let the writer finish pending batches, then exit on the sentinel.
+            self._outbox.put_nowait(None)
+            await self._writer
+            self._writer = None
         self._stopped_event.set()
         self._logger.debug("Stop complete")
 
     async def _listen_for_messages(self) -> None:
         """Listen for messages / commands from main / parent process over stdin."""
         self._logger.debug("Listening for messages from main process")
-        msg = ""
-        while msg != "q":
-            async with self._lock:
-                if not self._running:
-                    return
+        msg = b""
+        while msg != b"q":
+            if not self._running:
+                return
 
             msg = await self._read()
+            if msg == b"q":
+                break
 
             try:
-                parsed = json.loads(msg)
-            except (json.JSONDecodeError, TypeError) as e:
+                parsed = orjson.loads(msg)
+            except (orjson.JSONDecodeError, TypeError) as e:
                 self._logger.error(f"Failed to parse message from main process: {e}")
                 continue
 
             await self._handle_message(parsed)
 
-    async def _handle_message(self, msg: dict):
+    async def _handle_message(self, msg: dict) -> None:
         """Handle message / command from main / parent process."""
         data = msg["data"]
         command = msg["command"]
@@ -141,42 +184,101 @@ class ConnectionRunner:
             )
             return
 
-        match command:
-            case "PING":
-                self._send_command(
-                    "PONG", {"original": msg["data"], "subprocess_time": time.time()}
-                )
-            case "SEND":
-                await self._connection.send(data)
-            case "CREATE_PROPOSAL":
-                proposal = await self._connection.create_subscriber_proposal(data)
-                self._send_command("CONNECTION_PROPOSAL", proposal, command_nr)
-            case "HANDLE_OFFER":
-                try:
-                    answer = await self._connection.handle_subscriber_offer(data)
-                except ErrorDictException as e:
-                    self._send_command("CONNECTION_ANSWER", e.error_message, command_nr)
-                    return
-                self._send_command("CONNECTION_ANSWER", answer, command_nr)
-            case "STOP_SUBCONNECTION":
-                await self._connection.stop_subconnection(data)
-            case "SET_MUTED":
-                video, audio = data
-                await self._connection.set_muted(video, audio)
-            case "SET_VIDEO_FILTERS":
-                await self._connection.set_video_filters(data)
-            case "SET_AUDIO_FILTERS":
-                await self._connection.set_audio_filters(data)
-            case "START_RECORDING":
-                await self._connection.start_recording()
-            case "STOP_RECORDING":
-                await self._connection.stop_recording()
-            case _:
-                self._logger.error(f"Unrecognized command from main process: {command}")
-
-    async def _read(self):
+        handler = self._handlers.get(command)
+        if handler is None:
+            self._logger.error(f"Unrecognized command from main process: {command}")
+            return
+        await handler(data, command_nr)
+
+    async def _handle_ping(self, data: Any, command_nr: int) -> None:
+        """Handle `PING` command from main / parent process."""
+        self._send_command("PONG", {"original": data, "subprocess_time": time.time()})
+
+    async def _handle_send(self, data: Any, command_nr: int) -> None:
+        """Handle `SEND` command from main / parent process."""
+        await self._connection.send(data)
+
+    async def _handle_create_proposal(self, data: Any, command_nr: int) -> None:
+        """Handle `CREATE_PROPOSAL` command from main / parent process."""
+        proposal = await self._connection.create_subscriber_proposal(data)
+        self._send_command("CONNECTION_PROPOSAL", proposal, command_nr)
+
+    async def _handle_offer(self, data: Any, command_nr: int) -> None:
+        """Handle `HANDLE_OFFER` command from main / parent process."""
+        try:
+            answer = await self._connection.handle_subscriber_offer(data)
+        except ErrorDictException as e:
+            self._send_command("CONNECTION_ANSWER", e.error_message, command_nr)
+            return
+        self._send_command("CONNECTION_ANSWER", answer, command_nr)
+
+    async def _handle_stop_subconnection(self, data: Any, command_nr: int) -> None:
+        """Handle `STOP_SUBCONNECTION` command from main / parent process."""
+        await self._connection.stop_subconnection(data)
+
+    async def _handle_set_muted(self, data: Any, command_nr: int) -> None:
+        """Handle `SET_MUTED` command from main / parent process."""
+        video, audio = data
+        await self._connection.set_muted(video, audio)
+
+    async def _handle_set_video_filters(self, data: Any, command_nr: int) -> None:
+        """Handle `SET_VIDEO_FILTERS` command from main / parent process."""
+        await self._connection.set_video_filters(data)
+
+    async def _handle_set_audio_filters(self, data: Any, command_nr: int) -> None:
+        """Handle `SET_AUDIO_FILTERS` command from main / parent process."""
+        await self._connection.set_audio_filters(data)
+
+    async def _handle_start_recording(self, data: Any, command_nr: int) -> None:
+        """Handle `START_RECORDING` command from main / parent process."""
+        await self._connection.start_recording()
+
+    async def _handle_stop_recording(self, data: Any, command_nr: int) -> None:
+        """Handle `STOP_RECORDING` command from main / parent process."""
+        await self._connection.stop_recording()
+
+    def _read_stdin(self) -> None:
+        """Read stdin and forward complete lines to `_inbox`.
+
+        Intended to run on a dedicated background thread.  Reads stdin in large
+        chunks instead of line by line and returns when stdin reaches EOF.
+        Lines are sliced out of a reused bytearray via memoryview, avoiding the
+        intermediate allocations of `bytes.split`, and handed to the event loop
+        in one callback per chunk.
+
+        Reads the raw file descriptor instead of `sys.stdin.buffer`, a daemon
+        thread blocked in `BufferedReader.read1` holds the buffer lock and
+        aborts interpreter shutdown with `_enter_buffered_busy` if the parent
+        still has the pipe open when this process exits.
+        """
+        fd = sys.stdin.fileno()
+        buffer = bytearray()
+        while True:
+            chunk = os.read(fd, 65536)
+            if chunk == b"":
+                return
+            buffer += chunk
+
+            lines: list[bytes] = []
+            start = 0
+            with memoryview(buffer) as view:
+                while (newline := buffer.find(b"\n", start)) != -1:
+                    lines.append(bytes(view[start:newline]))
+                    start = newline + 1
+            if start:
+                del buffer[:start]
+
+            if lines:
+                self._loop.call_soon_threadsafe(self._enqueue_lines, lines)
+
+    def _enqueue_lines(self, lines: list[bytes]) -> None:
+        """Put lines from `_read_stdin` into `_inbox`.  Runs on the event loop."""
+        for line in lines:
+            self._inbox.put_nowait(line)
+
+    async def _read(self) -> bytes:
         """Read line from stdin.  Non-blocking and awaitable."""
-        return await asyncio.get_event_loop().run_in_executor(None, sys.stdin.readline)
+        return await self._inbox.get()
 
     async def _handle_state_change(self, state: ConnectionState) -> None:
         """Handle state change from `_connection`."""
@@ -185,9 +287,14 @@ class ConnectionRunner:
             self._logger.debug(f"Stopping, because state is {state}")
             await self.stop()
 
-    async def _relay_api_message(self, message: MessageDict | Any) -> None:
-        """Relay api messages from `_connection` to parent process."""
+    def _relay_api_message(self, message: MessageDict | Any) -> Awaitable[None]:
+        """Relay api messages from `_connection` to parent process.
+
+        Synchronous, but returns an already-completed future so `_connection`
+        can await the result without a coroutine being created per message.
+        """
         self._send_command("API", message)
+        return self._relay_done
 
     def _send_command(
         self,
@@ -213,5 +320,78 @@ class ConnectionRunner:
             Command nr identifying requests with responses.  Only required if response
             must be identified with request.
         """
-        data = json.dumps({"command": command, "data": data, "command_nr": command_nr})
-        print(data, flush=True)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is self._loop and self._writer is not None and not self._writer.done():
+            self._outbox.put_nowait((command, data, command_nr))
+            return
+
+        # Caller outside the event loop, e.g. logging from a worker thread, or
+        # the writer already stopped, e.g. logs after `stop`.  Write directly,
+        # a single write call keeps the line intact.
+        payload: bytes = orjson.dumps(
+            {"command": command, "data": data, "command_nr": command_nr}
+        )
+        sys.stdout.buffer.write(payload + b"\n")
+        sys.stdout.buffer.flush()
+
+    async def _write_outbox(self) -> None:
+        """Encode and write queued outgoing commands.
+
+        Runs until a `None` sentinel is received from `stop`.  Drains all
+        queued commands per wakeup, combining bursts into a single write and
+        flush.  Batches containing commands from `_OFFLOAD_COMMANDS` are
+        encoded on a thread to keep large payloads off the event loop.
+        """
+        stopping = False
+        while not stopping:
+            item = await self._outbox.get()
+            if item is None:
+                return
+            batch = [item]
+            while not self._outbox.empty():
+                item = self._outbox.get_nowait()
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            if any(command in self._OFFLOAD_COMMANDS for command, _, _ in batch):
+                out = await asyncio.to_thread(self._encode_batch, batch)
+            else:
+                out = self._encode_batch(batch)
+
+            if not out:
+                continue
+
+            try:
+                sys.stdout.buffer.write(out)
+                sys.stdout.buffer.flush()
+            except Exception as e:
+                # Not via `_logger`: the log handler feeds this outbox, a
+                # persistent write failure would wake the writer in a loop.
+                print(f"Failed to write commands to stdout: {e}", file=sys.stderr)
+
+    def _encode_batch(self, batch: list[tuple[str, Any, int]]) -> bytes:
+        """Encode outgoing commands into newline-delimited JSON lines.
+
+        Commands that fail to encode are logged and skipped, so one bad
+        payload does not drop the other commands batched with it.
+        """
+        lines: list[bytes] = []
+        for command, data, command_nr in batch:
+            try:
+                lines.append(
+                    orjson.dumps(
+                        {"command": command, "data": data, "command_nr": command_nr}
+                    )
+                    + b"\n"
+                )
+            except Exception as e:
+                # An unserializable payload must not kill the writer, that
+                # would silence every following command.
+                self._logger.error(f"Failed to encode {command} command: {e}")
+        return b"".join(lines)
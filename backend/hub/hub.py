@@ -90,6 +90,7 @@ class Hub:
             tasks.append(experimenter.disconnect())
 
         await asyncio.gather(*tasks)
+        await self.session_manager.stop()
 
     def remove_experimenter(self, experimenter: Experimenter):
         """Remove an experimenter from this hub.
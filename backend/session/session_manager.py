@@ -1,10 +1,15 @@
 """Provide the `SessionManager` class, which manages session data."""
 
 from __future__ import annotations
-import json
+import asyncio
 import logging
 import os
-from os.path import isfile, join
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
+import simdjson
+from os.path import join
 
 from session.data.session import SessionDict, is_valid_session
 
@@ -35,7 +40,13 @@ class SessionManager:
 
     _logger: logging.Logger
     _sessions: dict[str, SessionData]
+    _dict_cache: dict[str, SessionDict]
+    _dict_list_cache: list[SessionDict] | None
     _session_dir: str
+    _parser_store: threading.local
+    _dirty: set[str]
+    _dirty_event: asyncio.Event
+    _flusher: asyncio.Task | None
 
     def __init__(self, session_dir: str):
         """Instantiate new SessionManager, which manages session data.
@@ -50,7 +61,16 @@ class SessionManager:
         self._logger = logging.getLogger("SessionManager")
         self._logger.debug("Initiating SessionManager")
         self._sessions = {}
+        self._dict_cache = {}
+        self._dict_list_cache = None
+        self._dirty = set()
+        self._dirty_event = asyncio.Event()
+        self._flusher = None
         self._session_dir = join(BACKEND_DIR, session_dir)
+        # Parsers are reused across files, simdjson recommends parser reuse to
+        # avoid reallocating its internal buffers for every parse.  One parser
+        # per thread, a simdjson.Parser must not parse concurrently.
+        self._parser_store = threading.local()
         self._read_files_from_drive()
 
     def get_session_list(self):
@@ -71,8 +91,15 @@ class SessionManager:
         list of custom_types.session.SessionDict
             List containing all sessions managed by this SessionManager as dictionary.
         """
-        response = [s.asdict() for s in list(self._sessions.values())]
-        return response
+        if self._dict_list_cache is None:
+            dict_list = []
+            for session_id, session in self._sessions.items():
+                session_dict = self._dict_cache.get(session_id)
+                if session_dict is None:
+                    session_dict = self._dict_cache[session_id] = session.asdict()
+                dict_list.append(session_dict)
+            self._dict_list_cache = dict_list
+        return self._dict_list_cache
 
     def get_session(self, session_id: str):
         """Get the session with the given id.
@@ -172,7 +199,9 @@ class SessionManager:
         session.add_listener("update", self._handle_session_update)
         self._logger.info(f"New session created: {str(session)}")
         self._sessions[session_id] = session
-        self._write(session.asdict())
+        self._dict_cache[session_id] = session.asdict()
+        self._dict_list_cache = None
+        self._mark_dirty(session_id)
         return session
 
     def delete_session(self, session_id: str):
@@ -216,8 +245,14 @@ class SessionManager:
             )
 
         self._logger.info(f"Deleting session with ID: {session_id}")
+        # Drop the session from the manager before removing the file, so a
+        # concurrently flushing write sees it as deleted and skips it.
+        found = self._sessions.pop(session_id, None) is not None
+        self._dirty.discard(session_id)
+        self._dict_cache.pop(session_id, None)
+        self._dict_list_cache = None
         self._delete_file(f"{session_id}.json")
-        return self._sessions.pop(session_id, None) is not None
+        return found
 
     def _handle_session_update(self, session_data: SessionData):
         """Update session data changes on the drive.
@@ -242,21 +277,99 @@ class SessionManager:
 
         self._logger.debug(f"Handle session update: {session_data}")
         session = self._sessions[session_id]
-        self._write(session.asdict())
+        self._dict_cache[session_id] = session.asdict()
+        self._dict_list_cache = None
+        self._mark_dirty(session_id)
+
+    def _mark_dirty(self, session_id: str):
+        """Schedule a deferred write of the session with `session_id`.
+
+        Buffers the session id and wakes the background flusher, coalescing
+        bursts of updates into a single write per session.  Falls back to a
+        direct synchronous write if no event loop is running.
+
+        Parameters
+        ----------
+        session_id : str
+            Session id of the session that must be written to the drive.
+        """
+        if self._flusher is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                self._write(self._dict_cache[session_id])
+                return
+            self._flusher = loop.create_task(self._flush_sessions())
+
+        self._dirty.add(session_id)
+        self._dirty_event.set()
+
+    async def _flush_sessions(self):
+        """Write buffered dirty sessions to the drive.
+
+        Runs until cancelled.  Waits for `_dirty_event`, snapshots and clears
+        `_dirty` and offloads the file writes to a thread, keeping the event
+        loop free.
+        """
+        while True:
+            await self._dirty_event.wait()
+            self._dirty_event.clear()
+            dirty = list(self._dirty)
+            self._dirty.clear()
+            await asyncio.to_thread(self._write_dirty, dirty)
+
+    def _write_dirty(self, session_ids: list[str]):
+        """Write the cached dicts for `session_ids` to the drive.
+
+        Parameters
+        ----------
+        session_ids : list of str
+            Session ids that should be written.  Ids without a cached dict,
+            e.g. sessions deleted in the meantime, are skipped.
+        """
+        for session_id in session_ids:
+            session_dict = self._dict_cache.get(session_id)
+            if session_dict is not None:
+                self._write(session_dict)
+
+    async def stop(self):
+        """Stop the background flusher and write remaining dirty sessions."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+        if self._dirty:
+            dirty = list(self._dirty)
+            self._dirty.clear()
+            await asyncio.to_thread(self._write_dirty, dirty)
 
     def _generate_unique_session_id(self):
         """Generate an unique session id."""
-        existing_ids = list(self._sessions)
-        return generate_unique_id(existing_ids)
+        # Pass the keys view directly, membership checks on it are O(1).
+        return generate_unique_id(self._sessions.keys())
 
     def _read_files_from_drive(self):
         """Read sessions saved on the drive, save in `self._sessions`."""
         filenames = self._get_filenames()
         self._logger.debug(f"Found {len(filenames)} files: {filenames}")
 
+        # Read and parse the files on a thread pool, overlapping disk I/O.
+        # Validation and `self._sessions` mutations stay on this thread.
+        if filenames:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                session_dicts = list(pool.map(self._read, filenames))
+        else:
+            session_dicts = []
+
         sessions_with_missing_ids: list[SessionDict] = []
-        for file in filenames:
-            session_dict: SessionDict = self._read(file)
+        for file, session_dict in zip(filenames, session_dicts):
+            if session_dict is None:
+                self._logger.error(f"Invalid session file: {file}. Ignoring file")
+                continue
+
             session_dict["creation_time"] = 0
 
             if not is_valid_session(session_dict):
@@ -292,28 +405,64 @@ class SessionManager:
 
     def _get_filenames(self):
         """Get all filenames of files in `self._session_dir`."""
-        filenames: list[str] = []
-        for filename in os.listdir(self._session_dir):
-            if isfile(join(self._session_dir, filename)) and filename.endswith(".json"):
-                filenames.append(filename)
-        return filenames
+        with os.scandir(self._session_dir) as entries:
+            return [
+                entry.name
+                for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            ]
 
     def _read(self, filename: str):
         """Read a json file.
 
+        Checks required top-level fields on the lazy simdjson document before
+        materializing the full python dict, so structurally invalid files are
+        rejected without paying for a complete parse into python objects.
+
         Parameters
         ----------
         filename : str
             name of the required file inside `self._session_dir`.
+
+        Returns
+        -------
+        dict or None
+            Parsed file contents, or None if the file is not a json object
+            with the required session fields.
         """
         path = join(self._session_dir, filename)
-        with open(path, "r") as file:
-            data = json.load(file)
-            return data
+        with open(path, "rb") as file:
+            document = self._get_parser().parse(file.read())
+
+        try:
+            if not (
+                isinstance(document["id"], str)
+                and isinstance(document["title"], str)
+                and isinstance(document["start_time"], int)
+                and isinstance(document["end_time"], int)
+                and isinstance(document["participants"], simdjson.Array)
+            ):
+                return None
+        except (KeyError, TypeError):
+            return None
+
+        return document.as_dict()
+
+    def _get_parser(self) -> simdjson.Parser:
+        """Get the reusable simdjson parser for the current thread."""
+        parser = getattr(self._parser_store, "parser", None)
+        if parser is None:
+            parser = simdjson.Parser()
+            self._parser_store.parser = parser
+        return parser
 
     def _write(self, session_dict: SessionDict):
         """Write a json file.
 
+        Writes to a temporary file and atomically renames it over the final
+        path, so a crash mid-write cannot leave a corrupt session file.  A
+        stale `.tmp` file is ignored by `_get_filenames` on the next startup.
+
         Parameters
         ----------
         session_dict : session.data.session.SessionDict
@@ -324,10 +473,21 @@ class SessionManager:
             self._logger.error("Cannot save session without ID")
             return
 
+        if session_dict["id"] not in self._sessions:
+            # The session was deleted after this write was scheduled, e.g.
+            # while the flusher ran on a thread.  Writing now would resurrect
+            # the deleted file on the next startup.
+            self._logger.debug(
+                f"Skipping write for deleted session: {session_dict['id']}"
+            )
+            return
+
         filename = f"{session_dict['id']}.json"
         path = join(self._session_dir, filename)
-        with open(path, "w") as file:
-            json.dump(session_dict, file, indent=4)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as file:
+            file.write(orjson.dumps(session_dict, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, path)
 
     def _delete_file(self, filename: str):
         """Delete a file in the "sessions" folder.